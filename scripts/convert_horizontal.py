@@ -79,8 +79,57 @@ def replace_punctuation(content):
     return _v2h_re.sub(lambda m: V2H_PUNCTUATION[m.group()], content)
 
 
-def convert_direct(epub_path, output_path):
-    """Convert epub to horizontal layout via direct file manipulation."""
+# Fixed entry metadata for reproducible archives (1980-01-01 is the zip epoch)
+_REPRODUCIBLE_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+_REPRODUCIBLE_FILE_MODE = 0o100644
+_REPRODUCIBLE_DIR_MODE = 0o040755
+_REPRODUCIBLE_COMPRESSLEVEL = 9
+
+
+def _write_epub(tmpdir, names, output_path, reproducible=False):
+    """Zip extracted entries from tmpdir into output_path.
+
+    mimetype is always written first and uncompressed. With reproducible=True,
+    entries are sorted and get fixed timestamps, permissions and compression
+    level with no extra fields, so identical content yields identical bytes.
+    """
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zout:
+        if not reproducible:
+            mimetype_path = os.path.join(tmpdir, "mimetype")
+            if os.path.exists(mimetype_path):
+                zout.write(mimetype_path, "mimetype", compress_type=zipfile.ZIP_STORED)
+            for name in names:
+                if name == "mimetype":
+                    continue
+                zout.write(os.path.join(tmpdir, name), name)
+            return
+
+        ordered = sorted(set(names), key=lambda n: (n != "mimetype", n))
+        for name in ordered:
+            info = zipfile.ZipInfo(name, date_time=_REPRODUCIBLE_DATE_TIME)
+            info.create_system = 3  # Unix, so external_attr holds the mode
+            if name.endswith("/"):
+                info.external_attr = (_REPRODUCIBLE_DIR_MODE << 16) | 0x10
+                zout.writestr(info, b"", compress_type=zipfile.ZIP_STORED)
+                continue
+            info.external_attr = _REPRODUCIBLE_FILE_MODE << 16
+            with open(os.path.join(tmpdir, name), "rb") as f:
+                data = f.read()
+            if name == "mimetype":
+                zout.writestr(info, data, compress_type=zipfile.ZIP_STORED)
+            else:
+                zout.writestr(
+                    info, data,
+                    compress_type=zipfile.ZIP_DEFLATED,
+                    compresslevel=_REPRODUCIBLE_COMPRESSLEVEL,
+                )
+
+
+def convert_direct(epub_path, output_path, reproducible=False):
+    """Convert epub to horizontal layout via direct file manipulation.
+
+    With reproducible=True, the same input always produces byte-identical output.
+    """
     with tempfile.TemporaryDirectory() as tmpdir:
         # Extract
         with zipfile.ZipFile(epub_path, "r") as zf:
@@ -111,15 +160,7 @@ def convert_direct(epub_path, output_path):
                 with open(full, "w", encoding="utf-8") as f:
                     f.write(content)
 
-        # Re-zip: mimetype must be first, uncompressed
-        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zout:
-            mimetype_path = os.path.join(tmpdir, "mimetype")
-            if os.path.exists(mimetype_path):
-                zout.write(mimetype_path, "mimetype", compress_type=zipfile.ZIP_STORED)
-            for name in names:
-                if name == "mimetype":
-                    continue
-                zout.write(os.path.join(tmpdir, name), name)
+        _write_epub(tmpdir, names, output_path, reproducible)
 
     print(f"Converted (direct): {output_path}")
 
@@ -147,7 +188,7 @@ _CALIBRE_PLUGIN_SCRIPT = (
 )
 
 
-def convert_via_calibre(epub_path, output_path, calibre_debug):
+def convert_via_calibre(epub_path, output_path, calibre_debug, reproducible=False):
     """Convert epub using Calibre's TradSimpChinese plugin CLI."""
     with tempfile.TemporaryDirectory() as tmpdir:
         script_path = os.path.join(tmpdir, "_plugin_runner.py")
@@ -181,13 +222,13 @@ def convert_via_calibre(epub_path, output_path, calibre_debug):
         generated = os.path.join(tmpdir, outputs[0])
 
         # Post-process: fix spine direction (plugin may not handle this)
-        _fix_spine_in_epub(generated, output_path)
+        _fix_spine_in_epub(generated, output_path, reproducible)
 
     print(f"Converted (Calibre): {output_path}")
     return True
 
 
-def _fix_spine_in_epub(epub_path, output_path):
+def _fix_spine_in_epub(epub_path, output_path, reproducible=False):
     """Read epub, fix spine direction, write to output_path."""
     with tempfile.TemporaryDirectory() as tmpdir:
         with zipfile.ZipFile(epub_path, "r") as zf:
@@ -203,14 +244,7 @@ def _fix_spine_in_epub(epub_path, output_path):
             with open(opf_full, "w", encoding="utf-8") as f:
                 f.write(fixed)
 
-        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zout:
-            mimetype_path = os.path.join(tmpdir, "mimetype")
-            if os.path.exists(mimetype_path):
-                zout.write(mimetype_path, "mimetype", compress_type=zipfile.ZIP_STORED)
-            for name in names:
-                if name == "mimetype":
-                    continue
-                zout.write(os.path.join(tmpdir, name), name)
+        _write_epub(tmpdir, names, output_path, reproducible)
 
 
 def _make_test_epub(path, writing_mode="vertical-rl", page_direction="rtl"):
@@ -314,6 +348,10 @@ def main():
     )
     parser.add_argument("input", nargs="?", help="Input epub file path")
     parser.add_argument("-o", "--output", help="Output epub file path (default: <input>_horizontal.epub)")
+    parser.add_argument(
+        "--reproducible", action="store_true",
+        help="Write byte-identical output for identical input (fixed timestamps, permissions and entry order)",
+    )
     parser.add_argument("--self-test", action="store_true", help="Run self-test with a generated test epub")
     args = parser.parse_args()
 
@@ -344,7 +382,7 @@ def main():
 
     # Direct manipulation first
     try:
-        convert_direct(args.input, output)
+        convert_direct(args.input, output, reproducible=args.reproducible)
         return 0
     except Exception as e:
         print(f"Direct manipulation failed: {e}, falling back to Calibre.", file=sys.stderr)
@@ -353,7 +391,7 @@ def main():
     calibre = find_calibre_debug()
     if calibre:
         print(f"Using Calibre: {calibre}")
-        if convert_via_calibre(args.input, output, calibre):
+        if convert_via_calibre(args.input, output, calibre, reproducible=args.reproducible):
             return 0
     print("All conversion methods failed.", file=sys.stderr)
     return 1
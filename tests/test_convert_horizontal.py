@@ -232,6 +232,39 @@ class TestConvertDirect:
             opf = zf.read("OEBPS/content.opf").decode("utf-8")
             assert "page-progression-direction" not in opf
 
+    def test_reproducible_byte_identical(self, tmp_epub, tmp_path):
+        src = tmp_epub()
+        # Same content, different entry timestamps and order
+        restamped = str(tmp_path / "restamped.epub")
+        with zipfile.ZipFile(src, "r") as zin, zipfile.ZipFile(restamped, "w") as zout:
+            for info in reversed(zin.infolist()):
+                data = zin.read(info)
+                info.date_time = (2001, 2, 3, 4, 5, 6)
+                zout.writestr(info, data)
+
+        out1 = str(tmp_path / "out1.epub")
+        out2 = str(tmp_path / "out2.epub")
+        convert_direct(src, out1, reproducible=True)
+        convert_direct(restamped, out2, reproducible=True)
+
+        with open(out1, "rb") as f1, open(out2, "rb") as f2:
+            assert f1.read() == f2.read()
+
+    def test_reproducible_entry_metadata(self, tmp_epub, tmp_path):
+        src = tmp_epub()
+        out = str(tmp_path / "output.epub")
+        convert_direct(src, out, reproducible=True)
+
+        with zipfile.ZipFile(out, "r") as zf:
+            names = zf.namelist()
+            assert names[0] == "mimetype"
+            assert names[1:] == sorted(names[1:])
+            assert zf.getinfo("mimetype").compress_type == zipfile.ZIP_STORED
+            for info in zf.infolist():
+                assert info.date_time == (1980, 1, 1, 0, 0, 0)
+                assert info.external_attr >> 16 == 0o100644
+                assert info.extra == b""
+
 
 class TestFindCalibreDebug:
     def test_not_found(self):